@@ -49,6 +49,12 @@ setup(
     entry_points={"console_scripts": ("varfish-cli = varfish_cli.__main__:main",)},
     description="Command line interface client for VarFish Server.",
     install_requires=install_requirements,
+    extras_require={
+        # Optional C extension for fast ISO-8601 timestamp parsing.
+        "ciso8601": ["ciso8601 >=2.2,<3.0"],
+        # Optional fast JSON encoding/decoding.
+        "orjson": ["orjson >=3.6,<4.0"],
+    },
     license="MIT license",
     long_description=readme + "\n\n" + changelog,
     long_description_content_type="text/markdown",
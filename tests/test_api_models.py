@@ -0,0 +1,33 @@
+"""Tests for the converter hooks in ``varfish_cli.api.models``."""
+
+import datetime
+
+import pytest
+
+from varfish_cli.api import models
+
+
+def test_structure_datetime_z_suffix():
+    result = models.CONVERTER.structure("2022-01-01T12:00:00Z", datetime.datetime)
+    assert result == datetime.datetime(2022, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+def test_structure_datetime_explicit_offset():
+    result = models.CONVERTER.structure("2022-01-01T12:00:00+02:00", datetime.datetime)
+    assert result.utcoffset() == datetime.timedelta(hours=2)
+    assert result.replace(tzinfo=None) == datetime.datetime(2022, 1, 1, 12)
+
+
+def test_structure_datetime_nonstandard_uses_dateutil_fallback():
+    result = models.CONVERTER.structure("Sat, 1 Jan 2022 12:00:00", datetime.datetime)
+    assert result == datetime.datetime(2022, 1, 1, 12)
+
+
+def test_structure_enum():
+    assert models.CONVERTER.structure("mnv", models.EffectsV1) == models.EffectsV1.MNV
+
+
+def test_structure_enum_invalid_value():
+    with pytest.raises(ValueError) as exc_info:
+        models.CONVERTER.structure("not-an-effect", models.EffectsV1)
+    assert "not-an-effect" in str(exc_info.value)
@@ -0,0 +1,29 @@
+"""Tests for the shared helpers in ``varfish_cli.common``."""
+
+import io
+import json
+
+from varfish_cli import common
+
+
+def dump_to_str(data, compact=False):
+    buf = io.StringIO()
+    common.dump_json(data, buf, compact=compact)
+    return buf.getvalue()
+
+
+def test_dump_json():
+    assert json.loads(dump_to_str({"a": [1, 2], "b": "x"})) == {"a": [1, 2], "b": "x"}
+
+
+def test_dump_json_compact():
+    assert dump_to_str({"a": [1, 2], "b": "x"}, compact=True) == '{"a":[1,2],"b":"x"}'
+
+
+def test_dump_json_stdlib_fallback_equivalent(monkeypatch):
+    data = {"a": [1, 2], "b": "x", "c": None}
+    with_orjson = dump_to_str(data), dump_to_str(data, compact=True)
+    monkeypatch.setattr(common, "orjson", None)
+    with_stdlib = dump_to_str(data), dump_to_str(data, compact=True)
+    assert json.loads(with_orjson[0]) == json.loads(with_stdlib[0]) == data
+    assert with_orjson[1] == with_stdlib[1]
@@ -0,0 +1,45 @@
+import json
+import pathlib
+
+import requests_mock
+
+from varfish_cli.__main__ import main
+
+#: UUID of the query to get the status for.
+QUERY_UUID = "c3752df7-fa32-4784-8a48-e8f0e5a28790"
+
+#: Status as returned by the mocked server.
+QUERY_STATUS = {"query": QUERY_UUID, "status": "done"}
+
+
+def run_small_var_query_status(capsys, *extra_args):
+    url = "https://varfish.example.com"
+    address = "%s/variants/api/query-case/status/%s/" % (url, QUERY_UUID)
+    with requests_mock.Mocker() as m:
+        m.get(address, json=QUERY_STATUS)
+        base_dir = pathlib.Path(__file__).parent
+        main(
+            [
+                "--config",
+                str(base_dir / "data/config/varfishrc.toml"),
+                "case",
+                "small-var-query-status",
+                *extra_args,
+                QUERY_UUID,
+            ]
+        )
+    return capsys.readouterr().out
+
+
+def test_run_small_var_query_status(capsys):
+    out = run_small_var_query_status(capsys)
+    assert json.loads(out) == QUERY_STATUS
+    # Two-space indented by default.
+    assert '\n  "' in out
+
+
+def test_run_small_var_query_status_compact(capsys):
+    out = run_small_var_query_status(capsys, "--compact")
+    assert json.loads(out) == QUERY_STATUS
+    # No indentation with --compact.
+    assert "\n  " not in out
@@ -26,7 +26,7 @@ from varfish_cli.api.models import (
     SmallVariantV1,
     VariantSetImportInfo,
 )
-from varfish_cli.common import strip_trailing_slash
+from varfish_cli.common import load_json_response, strip_trailing_slash
 
 from ..exceptions import RestApiCallException
 
@@ -137,7 +137,7 @@ def _paginated_request(endpoint, result_data=None, **kwargs):
     result = requests.get(endpoint, **kwargs)
     result.raise_for_status()
 
-    result_json = result.json()
+    result_json = load_json_response(result)
     if "results" in result_json and "next" in result_json:
         result_data += result_json["results"]
         return _paginated_request(result_json["next"], result_data=result_data, **kwargs)
@@ -176,7 +176,7 @@ def case_retrieve(
     headers = {"Authorization": "Token %s" % api_token}
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     result.raise_for_status()
-    return CONVERTER.structure(result.json(), CaseImportInfo)
+    return CONVERTER.structure(load_json_response(result), CaseImportInfo)
 
 
 def case_import_info_list(
@@ -209,7 +209,7 @@ def case_import_info_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[CaseImportInfo])
+        return CONVERTER.structure(load_json_response(result), typing.List[CaseImportInfo])
 
 
 def case_import_info_retrieve(
@@ -239,7 +239,7 @@ def case_import_info_retrieve(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), CaseImportInfo)
+        return CONVERTER.structure(load_json_response(result), CaseImportInfo)
 
 
 def case_import_info_create(
@@ -271,7 +271,7 @@ def case_import_info_create(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), CaseImportInfo)
+        return CONVERTER.structure(load_json_response(result), CaseImportInfo)
 
 
 def case_import_info_update(
@@ -306,7 +306,7 @@ def case_import_info_update(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), CaseImportInfo)
+        return CONVERTER.structure(load_json_response(result), CaseImportInfo)
 
 
 def variant_set_import_info_list(
@@ -334,7 +334,7 @@ def variant_set_import_info_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[VariantSetImportInfo])
+        return CONVERTER.structure(load_json_response(result), typing.List[VariantSetImportInfo])
 
 
 def variant_set_import_info_create(
@@ -365,7 +365,7 @@ def variant_set_import_info_create(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), VariantSetImportInfo)
+        return CONVERTER.structure(load_json_response(result), VariantSetImportInfo)
 
 
 def variant_set_import_info_update(
@@ -401,7 +401,7 @@ def variant_set_import_info_update(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), VariantSetImportInfo)
+        return CONVERTER.structure(load_json_response(result), VariantSetImportInfo)
 
 
 def bam_qc_file_list(
@@ -428,7 +428,7 @@ def bam_qc_file_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[BamQcFile])
+        return CONVERTER.structure(load_json_response(result), typing.List[BamQcFile])
 
 
 def bam_qc_file_upload(
@@ -459,7 +459,7 @@ def bam_qc_file_upload(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), BamQcFile)
+        return CONVERTER.structure(load_json_response(result), BamQcFile)
 
 
 def bam_qc_file_destroy(
@@ -514,7 +514,7 @@ def case_gene_annotation_file_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[CaseGeneAnnotationFile])
+        return CONVERTER.structure(load_json_response(result), typing.List[CaseGeneAnnotationFile])
 
 
 def case_gene_annotation_file_upload(
@@ -547,7 +547,7 @@ def case_gene_annotation_file_upload(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), CaseGeneAnnotationFile)
+        return CONVERTER.structure(load_json_response(result), CaseGeneAnnotationFile)
 
 
 def case_gene_annotation_file_destroy(
@@ -605,7 +605,7 @@ def genotype_file_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[GenotypeFile])
+        return CONVERTER.structure(load_json_response(result), typing.List[GenotypeFile])
 
 
 def genotype_file_upload(
@@ -638,7 +638,7 @@ def genotype_file_upload(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), GenotypeFile)
+        return CONVERTER.structure(load_json_response(result), GenotypeFile)
 
 
 def genotype_file_destroy(
@@ -696,7 +696,7 @@ def effects_file_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[EffectsFile])
+        return CONVERTER.structure(load_json_response(result), typing.List[EffectsFile])
 
 
 def effects_file_upload(
@@ -729,7 +729,7 @@ def effects_file_upload(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), EffectsFile)
+        return CONVERTER.structure(load_json_response(result), EffectsFile)
 
 
 def effects_file_destroy(
@@ -787,7 +787,7 @@ def db_info_file_list(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), typing.List[DatabaseInfoFile])
+        return CONVERTER.structure(load_json_response(result), typing.List[DatabaseInfoFile])
 
 
 def db_info_file_upload(
@@ -820,7 +820,7 @@ def db_info_file_upload(
             msg = "REST API returned status code %d: %s" % (result.status_code, result.content)
         raise RestApiCallException(msg)
     else:
-        return CONVERTER.structure(result.json(), DatabaseInfoFile)
+        return CONVERTER.structure(load_json_response(result), DatabaseInfoFile)
 
 
 def db_info_file_destroy(
@@ -862,7 +862,7 @@ def small_var_query_list(
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return CONVERTER.structure(result.json(), typing.List[CaseQueryResultV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[CaseQueryResultV1])
 
 
 def small_var_query_create(
@@ -882,7 +882,7 @@ def small_var_query_create(
     )
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return CONVERTER.structure(result.json(), CaseQueryV1)
+    return CONVERTER.structure(load_json_response(result), CaseQueryV1)
 
 
 def small_var_query_retrieve(
@@ -895,7 +895,7 @@ def small_var_query_retrieve(
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return result.json()
+    return load_json_response(result)
 
 
 def small_var_query_status(
@@ -908,7 +908,7 @@ def small_var_query_status(
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return result.json()
+    return load_json_response(result)
 
 
 def small_var_query_update(
@@ -938,7 +938,7 @@ def small_var_query_update(
     )
     if not result_put.ok:
         raise _construct_rest_api_call_exception(result_put)
-    return result_put.json()
+    return load_json_response(result_put)
 
 
 def small_var_query_fetch_results(
@@ -954,7 +954,7 @@ def small_var_query_fetch_results(
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return CONVERTER.structure(result.json(), typing.List[SmallVariantV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[SmallVariantV1])
 
 
 def small_var_query_settings_shortcut(
@@ -995,4 +995,4 @@ def small_var_query_settings_shortcut(
     result = requests.get(endpoint, headers=headers, params=params, verify=verify_ssl)
     if not result.ok:
         raise _construct_rest_api_call_exception(result)
-    return CONVERTER.structure(result.json(), QueryShortcutsResultV1)
+    return CONVERTER.structure(load_json_response(result), QueryShortcutsResultV1)
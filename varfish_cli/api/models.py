@@ -2,16 +2,23 @@
 
 import datetime
 from enum import Enum, unique
+import functools
 import re
+import sys
 import typing
 import uuid
 
 import attr
 import cattr
-import dateutil.parser
+from cattr.gen import make_dict_structure_fn, make_dict_unstructure_fn
 
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None
 
-@attr.s(frozen=True, auto_attribs=True)
+
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class PedigreeMember:
     """Represent a pedigree member as returned by the VarFish API."""
 
@@ -29,7 +36,7 @@ class PedigreeMember:
     has_gt_entries: bool
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class Case:
     """Represent a case as returned by the VarFish API."""
 
@@ -94,7 +101,7 @@ class GenomeBuild(Enum):
     GRCH38 = "GRCh38"
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class CaseImportInfo:
     """Case import information as returned by the VarFish API."""
 
@@ -123,7 +130,7 @@ class CaseImportInfo:
     #: Notes
     notes: typing.Optional[str] = None
     #: Tags
-    tags: typing.List[str] = attr.Factory(list)
+    tags: typing.Tuple[str, ...] = ()
 
 
 class CaseVariantType(Enum):
@@ -135,7 +142,7 @@ class CaseVariantType(Enum):
     STRUCTURAL = "STRUCTURAL"
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class VariantSetImportInfo:
     """Information on importing a set of variants."""
 
@@ -156,7 +163,7 @@ class VariantSetImportInfo:
     state: VariantSetImportState = VariantSetImportState.DRAFT
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class BamQcFile:
     """Information for BAM QC file without the payload."""
 
@@ -175,7 +182,7 @@ class BamQcFile:
     case_import_info: typing.Optional[uuid.UUID] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class CaseGeneAnnotationFile:
     """Information for Gene Annotation file without the payload."""
 
@@ -194,7 +201,7 @@ class CaseGeneAnnotationFile:
     case_import_info: typing.Optional[uuid.UUID] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class GenotypeFile:
     """Genotype file."""
 
@@ -213,7 +220,7 @@ class GenotypeFile:
     case_import_info: typing.Optional[uuid.UUID] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class EffectsFile:
     """Effects file."""
 
@@ -232,7 +239,7 @@ class EffectsFile:
     case_import_info: typing.Optional[uuid.UUID] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class DatabaseInfoFile:
     """Database information file."""
 
@@ -304,18 +311,21 @@ class FailChoiceV1(Enum):
 
 @unique
 class GenotypeChoiceV1(Enum):
-    ANY = "any"
-    REF = "ref"
-    HET = "het"
-    HOM = "hom"
-    NON_HOM = "non-hom"
-    REFERENCE = "reference"
-    VARIANT = "variant"
-    NON_VARIANT = "non-variant"
-    NON_REFERENCE = "non-reference"
-
-
-@attr.s(auto_attribs=True, frozen=True)
+    """Genotype choice, used per sample per variant; values are interned so
+    comparisons on ``.value`` are pointer-equality fast."""
+
+    ANY = sys.intern("any")
+    REF = sys.intern("ref")
+    HET = sys.intern("het")
+    HOM = sys.intern("hom")
+    NON_HOM = sys.intern("non-hom")
+    REFERENCE = sys.intern("reference")
+    VARIANT = sys.intern("variant")
+    NON_VARIANT = sys.intern("non-variant")
+    NON_REFERENCE = sys.intern("non-reference")
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class QualitySettingsV1:
     """Data structure to hold the information for quality settings"""
 
@@ -328,7 +338,7 @@ class QualitySettingsV1:
     fail: FailChoiceV1 = FailChoiceV1.IGNORE
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class RangeV1:
     """Data structure to hold a range"""
 
@@ -336,7 +346,7 @@ class RangeV1:
     end: int
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class GenomicRegionV1:
     """Data structure eto hold the information for genomic regions."""
 
@@ -357,7 +367,21 @@ def convert_genomic_region_v1(region: GenomicRegionV1):
         return (region.chromosome, None, None)
 
 
-@attr.s(auto_attribs=True, frozen=True)
+def convert_genomic_regions_v1(
+    regions: typing.Iterable[GenomicRegionV1],
+) -> typing.List[typing.Tuple[str, typing.Optional[int], typing.Optional[int]]]:
+    """Convert many genomic regions at once, avoiding one function call per region."""
+    return [
+        (
+            (region.chromosome, region.range.start, region.range.end)
+            if region.range
+            else (region.chromosome, None, None)
+        )
+        for region in regions
+    ]
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class CaseQuerySettingsV1:
     """Data structure to hold the information for a single case query"""
 
@@ -481,7 +505,7 @@ class CaseQuerySettingsV1:
     mitomap_frequency: typing.Optional[float] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class CaseQueryV1:
     public: bool = False
     query_settings: typing.Optional[typing.Dict[str, typing.Any]] = None
@@ -494,7 +518,7 @@ class CaseQueryV1:
     name: typing.Optional[str] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class QuickPresetsV1:
     inheritance: str
     frequency: str
@@ -505,13 +529,13 @@ class QuickPresetsV1:
     database: str
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class QueryShortcutsResultV1:
     presets: QuickPresetsV1
     query_settings: typing.Dict[str, typing.Any]
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class CaseQueryResultV1:
     """Case query as returned by API."""
 
@@ -526,7 +550,7 @@ class CaseQueryResultV1:
     query_settings: typing.Optional[typing.Any] = None
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class SmallVariantV1:
     """Small variant as returned by query result"""
 
@@ -577,6 +601,38 @@ class SmallVariantV1:
     ensembl_exon_dist: typing.Optional[int]
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_uuid(s: str) -> uuid.UUID:
+    """Parse UUID string, memoized as project/case UUIDs repeat many times in
+    typical API responses."""
+    return uuid.UUID(s)
+
+
+def _structure_datetime(d, _):
+    """Parse datetime string, using the fast ``fromisoformat`` path for the ISO-8601
+    timestamps returned by the VarFish API and falling back to ``dateutil`` for
+    nonstandard formats.
+
+    When the optional ``ciso8601`` C extension is installed it is preferred over
+    ``fromisoformat`` as it is faster still."""
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(d)
+        except (TypeError, ValueError):
+            pass
+    if isinstance(d, str):
+        s = d[:-1] + "+00:00" if d.endswith("Z") else d
+        try:
+            return datetime.datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    # Deferred import; dateutil is expensive to import and only needed for
+    # nonstandard timestamps.
+    import dateutil.parser
+
+    return dateutil.parser.parse(d)
+
+
 def _structure_genomic_region(s, _):
     if not re.match("^[a-zA-Z0-9]+(:(\\d+(,\\d+)*)-(\\d+(,\\d+)*))?$", s):
         raise RuntimeError("Invalid genomic region string: %s" % repr(s))
@@ -588,11 +644,11 @@ def _structure_genomic_region(s, _):
         return GenomicRegionV1(chromosome=s)
 
 
-def _setup_converter() -> cattr.Converter:
-    result = cattr.Converter()
-    result.register_structure_hook(uuid.UUID, lambda d, _: uuid.UUID(d))
+def _setup_converter() -> cattr.GenConverter:
+    result = cattr.GenConverter()
+    result.register_structure_hook(uuid.UUID, lambda d, _: _parse_uuid(d))
     result.register_unstructure_hook(uuid.UUID, str)
-    result.register_structure_hook(datetime.datetime, lambda d, _: dateutil.parser.parse(d))
+    result.register_structure_hook(datetime.datetime, _structure_datetime)
     result.register_unstructure_hook(
         datetime.datetime,
         lambda obj: obj.replace(tzinfo=datetime.timezone.utc)
@@ -602,6 +658,30 @@ def _setup_converter() -> cattr.Converter:
     )
     result.register_structure_hook(GenomicRegionV1, _structure_genomic_region)
     result.register_unstructure_hook(GenomicRegionV1, GenomicRegionV1.to_str)
+    # Structure enums through precomputed value->member tables instead of the
+    # default ``EnumCls(value)`` call, skipping the Enum metaclass dispatch for
+    # hot fields such as ``effects``.
+    for enum_cls in (
+        CaseImportState,
+        VariantSetImportState,
+        GenomeBuild,
+        CaseVariantType,
+        EffectsV1,
+        RecessiveModeV1,
+        FailChoiceV1,
+        GenotypeChoiceV1,
+    ):
+        members = {e.value: e for e in enum_cls}
+
+        def structure_enum(v, _, _members=members, _enum_cls=enum_cls):
+            try:
+                return _members[v]
+            except KeyError:
+                # Fall back to the Enum constructor so unknown values keep
+                # raising the descriptive ValueError.
+                return _enum_cls(v)
+
+        result.register_structure_hook(enum_cls, structure_enum)
     return result
 
 
@@ -609,7 +689,7 @@ def _setup_converter() -> cattr.Converter:
 CONVERTER = _setup_converter()
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class VarAnnoSetV1:
     """VarAnnoSet as returned by query result"""
 
@@ -632,7 +712,7 @@ class VarAnnoSetV1:
     fields: typing.List[str]
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, slots=True)
 class VarAnnoSetEntryV1:
     """VarAnnoSet as returned by query result"""
 
@@ -659,3 +739,57 @@ class VarAnnoSetEntryV1:
     alternative: str
     #: Data, the set's fields are the keys.
     payload: typing.Dict[str, str]
+
+
+#: The attrs model classes to register precompiled converter hooks for.  ``GenomicRegionV1``
+#: is excluded as it uses custom string-based hooks.
+_MODEL_CLASSES = (
+    PedigreeMember,
+    Case,
+    CaseImportInfo,
+    VariantSetImportInfo,
+    BamQcFile,
+    CaseGeneAnnotationFile,
+    GenotypeFile,
+    EffectsFile,
+    DatabaseInfoFile,
+    QualitySettingsV1,
+    RangeV1,
+    CaseQuerySettingsV1,
+    CaseQueryV1,
+    QuickPresetsV1,
+    QueryShortcutsResultV1,
+    CaseQueryResultV1,
+    SmallVariantV1,
+    VarAnnoSetV1,
+    VarAnnoSetEntryV1,
+)
+
+
+def _register_codegen_hooks(converter: cattr.Converter) -> None:
+    """Register code-generated structure/unstructure functions for the model classes.
+
+    The generated functions replace cattr's reflective per-field dispatch with
+    specialized straight-line code, which pays off when structuring large lists
+    of API records."""
+    structure_fns = {}
+    for cls in _MODEL_CLASSES:
+        structure_fns[cls] = make_dict_structure_fn(cls, converter)
+        converter.register_structure_hook(cls, structure_fns[cls])
+        converter.register_unstructure_hook(cls, make_dict_unstructure_fn(cls, converter))
+    # For the classes that come back as (potentially very long) lists, also register a
+    # list hook that calls the generated function directly in a tight comprehension,
+    # skipping the per-element dispatch of the generic ``List`` structuring.
+    list_hooks = {
+        typing.List[cls]: (structure_fns[cls], cls)
+        for cls in (PedigreeMember, Case, CaseQueryResultV1, SmallVariantV1, VarAnnoSetEntryV1)
+    }
+
+    def structure_model_list(v, t):
+        fn, cls = list_hooks[t]
+        return [fn(x, cls) for x in v]
+
+    converter.register_structure_hook_func(list_hooks.__contains__, structure_model_list)
+
+
+_register_codegen_hooks(CONVERTER)
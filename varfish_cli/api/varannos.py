@@ -8,7 +8,7 @@ from logzero import logger
 import requests
 
 from varfish_cli.api.models import CONVERTER, VarAnnoSetEntryV1, VarAnnoSetV1
-from varfish_cli.common import strip_trailing_slash
+from varfish_cli.common import load_json_response, strip_trailing_slash
 from varfish_cli.exceptions import RestApiCallException
 
 #: End point for listing & creating VarAnnoSets
@@ -46,7 +46,7 @@ def varannoset_list(
     headers = {"Authorization": "Token %s" % api_token}
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), typing.List[VarAnnoSetV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[VarAnnoSetV1])
 
 
 def varannoset_create(
@@ -68,7 +68,7 @@ def varannoset_create(
         endpoint, headers=headers, data=CONVERTER.unstructure(payload), verify=verify_ssl
     )
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), typing.List[VarAnnoSetV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[VarAnnoSetV1])
 
 
 def varannoset_retrieve(
@@ -87,7 +87,7 @@ def varannoset_retrieve(
     headers = {"Authorization": "Token %s" % api_token}
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), VarAnnoSetV1)
+    return CONVERTER.structure(load_json_response(result), VarAnnoSetV1)
 
 
 def varannoset_update(
@@ -109,7 +109,7 @@ def varannoset_update(
         endpoint, headers=headers, data=CONVERTER.unstructure(payload), verify=verify_ssl
     )
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), VarAnnoSetV1)
+    return CONVERTER.structure(load_json_response(result), VarAnnoSetV1)
 
 
 def varannoset_destroy(
@@ -146,7 +146,7 @@ def varannosetentry_list(
     headers = {"Authorization": "Token %s" % api_token}
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), typing.List[VarAnnoSetEntryV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[VarAnnoSetEntryV1])
 
 
 def varannosetentry_create(
@@ -168,7 +168,7 @@ def varannosetentry_create(
         endpoint, headers=headers, data=CONVERTER.unstructure(payload), verify=verify_ssl
     )
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), typing.List[VarAnnoSetEntryV1])
+    return CONVERTER.structure(load_json_response(result), typing.List[VarAnnoSetEntryV1])
 
 
 def varannosetentry_retrieve(
@@ -189,7 +189,7 @@ def varannosetentry_retrieve(
     headers = {"Authorization": "Token %s" % api_token}
     result = requests.get(endpoint, headers=headers, verify=verify_ssl)
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), VarAnnoSetEntryV1)
+    return CONVERTER.structure(load_json_response(result), VarAnnoSetEntryV1)
 
 
 def varannosetentry_update(
@@ -213,7 +213,7 @@ def varannosetentry_update(
         endpoint, headers=headers, data=CONVERTER.unstructure(payload), verify=verify_ssl
     )
     raise_for_status(result)
-    return CONVERTER.structure(result.json(), VarAnnoSetEntryV1)
+    return CONVERTER.structure(load_json_response(result), VarAnnoSetEntryV1)
 
 
 def varannosetentry_destroy(
@@ -1,7 +1,6 @@
 """Implementation of ``varfish-cli small-var-query-retrieve``"""
 
 import argparse
-import json
 import sys
 import uuid
 
@@ -9,10 +8,17 @@ from logzero import logger
 
 from varfish_cli import api
 from varfish_cli.case.config import CaseSmallVariantQueryRetrieveConfig
+from varfish_cli.common import dump_json
 
 
 def setup_argparse(parser):
     parser.add_argument("--hidden-cmd", dest="case_cmd", default=run, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--compact",
+        default=False,
+        action="store_true",
+        help="Write JSON output without indentation.",
+    )
     parser.add_argument("query_uuid", help="UUID of the query to retrieve.", type=uuid.UUID)
 
 
@@ -32,11 +38,11 @@ def run(config, toml_config, args, _parser, _subparser, file=sys.stdout):
     logger.info("Query Detail")
     logger.info("============")
     if config.case_config.output_file == "-":
-        json.dump(res, sys.stdout, indent="  ")
+        dump_json(res, sys.stdout, compact=args.compact)
         sys.stdout.write("\n")
         sys.stdout.flush()
     else:
         with open(config.case_config.output_file, "wt") as outputf:
-            json.dump(res, outputf, indent="  ")
+            dump_json(res, outputf, compact=args.compact)
             outputf.write("\n")
     logger.info("All done. Have a nice day!")
@@ -1,7 +1,6 @@
 """Implementation of ``varfish-cli small-var-query-update``"""
 
 import argparse
-import json
 import sys
 import uuid
 
@@ -9,10 +8,17 @@ from logzero import logger
 
 from varfish_cli import api
 from varfish_cli.case.config import CaseSmallVariantQueryUpdateConfig
+from varfish_cli.common import dump_json
 
 
 def setup_argparse(parser):
     parser.add_argument("--hidden-cmd", dest="case_cmd", default=run, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--compact",
+        default=False,
+        action="store_true",
+        help="Write JSON output without indentation.",
+    )
     parser.add_argument("--name", type=str, help="value to set the query name to (if given)")
     parser.add_argument(
         "--public",
@@ -44,6 +50,6 @@ def run(config, toml_config, args, _parser, _subparser, file=sys.stdout):
 
     print("Updated Query", file=file)
     print("=============", file=file)
-    json.dump(res, file, indent="  ")
+    dump_json(res, file, compact=args.compact)
     print(file=file)
     file.flush()
@@ -11,6 +11,11 @@ import uuid
 import attr
 from tabulate import tabulate
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class CustomEncoder(json.JSONEncoder):
     """JSON encoder for UUIds"""
@@ -66,6 +71,30 @@ class CommonConfig:
         )
 
 
+def dump_json(data: typing.Any, output_file: io.TextIOBase, compact: bool = False) -> None:
+    """Write ``data`` as JSON to ``output_file``, two-space indented unless ``compact``.
+
+    Uses the optional ``orjson`` library for fast C-level encoding when installed,
+    falling back to the stdlib ``json`` module otherwise."""
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        output_file.write(orjson.dumps(data, option=option).decode("utf-8"))
+    elif compact:
+        json.dump(data, output_file, separators=(",", ":"))
+    else:
+        json.dump(data, output_file, indent="  ")
+
+
+def load_json_response(response) -> typing.Any:
+    """Decode the JSON body of a ``requests`` response.
+
+    Parses the raw bytes with ``orjson`` when installed, skipping the intermediate
+    ``str`` copy of the body, and falls back to ``Response.json()`` otherwise."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def run_nocmd(_config, _toml_config, _args, parser, subparser=None):  # pragma: no cover
     """No command given, print help and ``exit(1)``."""
     if subparser:
@@ -77,35 +106,41 @@ def run_nocmd(_config, _toml_config, _args, parser, subparser=None):  # pragma:
 
 
 def write_output(
-    output: typing.List[typing.List[typing.Any]],
+    output: typing.Iterable[typing.List[typing.Any]],
     output_file: io.TextIOBase,
     output_format: OutputFormat,
     delimiter: str,
 ):
-    """Write output to ``output_file``"""
+    """Write output rows (header first) to ``output_file``.
+
+    ``output`` may be any iterable; for CSV the rows are streamed to the file one
+    at a time so large tables are never materialized as a whole."""
     if output_format == OutputFormat.CSV:
         writer = csv.writer(output_file, delimiter=delimiter)
         for row in output:
             writer.writerow(row)
     elif output_format == OutputFormat.JSON:
-        header = output[0]
-        output_json = []
-        for obj in output[1:]:
-            output_json.append(dict(zip(header, obj)))
+        rows = iter(output)
+        header = next(rows)
+        output_json = [dict(zip(header, obj)) for obj in rows]
         json.dump(output_json, output_file, cls=CustomEncoder)
     else:
-        output_file.write(tabulate(output[1:], headers=output[0], tablefmt="grid"))
+        rows = list(output)
+        output_file.write(tabulate(rows[1:], headers=rows[0], tablefmt="grid"))
     output_file.write("\n")
     output_file.flush()
 
 
 def tabular_output(
-    values: typing.List[typing.Any],
+    values: typing.Iterable[typing.Any],
     header: typing.List[str],
     field_formatters: typing.Dict[str, typing.Callable[[typing.Any], str]] = {},
-) -> typing.List[typing.List[str]]:
-    """Convert list of values to list of strings for output."""
-    output = [header]
+) -> typing.Iterator[typing.List[str]]:
+    """Convert values to rows of strings for output, starting with the header row.
+
+    Rows are generated lazily so record lists can flow through ``write_output``
+    without doubling peak memory."""
+    yield header
     for value in values:
         row = []
         for field in header:
@@ -114,8 +149,7 @@ def tabular_output(
             else:
                 the_value = getattr(value, field)
             row.append(the_value)
-        output.append(row)
-    return output
+        yield row
 
 
 def strip_trailing_slash(s: str) -> str:
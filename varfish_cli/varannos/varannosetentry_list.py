@@ -29,6 +29,10 @@ DEFAULT_FIELDS: typing.Dict[OutputFormat, typing.Optional[typing.Tuple[str]]] =
     OutputFormat.JSON: None,
 }
 
+#: All fields of ``VarAnnoSetEntryV1``, computed once at import as ``attrs.fields``
+#: walks the class metadata.
+_DEFAULT_HEADER = tuple(f.name for f in attrs.fields(api.VarAnnoSetEntryV1))
+
 
 def setup_argparse(parser):
     parser.add_argument("--hidden-cmd", dest="case_cmd", default=run, help=argparse.SUPPRESS)
@@ -41,11 +45,10 @@ def setup_argparse(parser):
 
 def run(varannos_config, toml_config, args, _parser, _subparser, file=sys.stdout):
     """Run VarAnnoSetEntry list command."""
-    varannos_config = attrs.evolve(
-        varannos_config,
-        output_fields=varannos_config.output_fields
-        or DEFAULT_FIELDS.get(varannos_config.output_format),
-    )
+    if not varannos_config.output_fields:
+        varannos_config = attrs.evolve(
+            varannos_config, output_fields=DEFAULT_FIELDS.get(varannos_config.output_format)
+        )
     config = VarAnnoSetEntryListConfig.create(args, varannos_config, toml_config)
     logger.info("Configuration: %s", config)
     logger.info("Listing VarAnnoSetEntrys")
@@ -58,11 +61,7 @@ def run(varannos_config, toml_config, args, _parser, _subparser, file=sys.stdout
     )
 
     logger.info("Generating output")
-    header = (
-        varannos_config.output_fields
-        if varannos_config.output_fields
-        else [f.name for f in attrs.fields(api.VarAnnoSetEntryV1)]
-    )
+    header = varannos_config.output_fields or _DEFAULT_HEADER
     output = tabular_output(values=res, header=header)
 
     logger.info("Writing output")